@@ -6,8 +6,11 @@ Calculation module. Contains calculations used in several modules.
 
 from pyrr import Vector3, Vector4, vector, matrix44, quaternion, Quaternion
 from sphere_base.utils import dump_exception
+import numpy as np
 import math
 
+NLERP_THRESHOLD = 0.97  # above this quaternion dot product NLERP is used instead of SLERP
+
 
 class Calc:
     """
@@ -80,6 +83,83 @@ class Calc:
 
         return Vector4(xyzw).xyz
 
+    @staticmethod
+    def move_to_positions(orientations, sphere, radius, out=None) -> np.ndarray:
+        """
+        Vectorized version of ``move_to_position``. Calculates the xyz positions for an array of orientations
+        in one go.
+
+        :param orientations: ``(n, 4)`` array of quaternions
+        :type orientations: ``np.ndarray``
+        :param sphere: The target sphere_base the items are on
+        :type sphere: :class:`~sphere_iot.uv_sphere.Sphere`
+        :param radius: The radius of the target sphere_base
+        :type radius: ´´float´´
+        :param out: optional ``(n, 8)`` float32 vertex buffer (vertex, texture, normal) that receives the results
+        :type out: ``np.ndarray``
+        :returns: ``(n, 3)`` float32 array with positions and ``(n, 3)`` float32 array with the normals
+
+        The node vector [0.0, 1.0, 0.0] rotated by a quaternion is the second row of its rotation matrix.
+        That row is at the same time the normal of the point on the surface of the sphere.
+
+        """
+
+        x, y, z, w = orientations[:, 0], orientations[:, 1], orientations[:, 2], orientations[:, 3]
+        inv_s = 1.0 / (x * x + y * y + z * z + w * w)  # same as pyrr, works for non-normalized quaternions
+
+        if out is None:
+            out = np.empty((len(orientations), 8), dtype=np.float32)
+        positions, normals = out[:, 0:3], out[:, 5:8]
+
+        normals[:, 0] = 2.0 * (x * y + z * w) * inv_s
+        normals[:, 1] = (-x * x + y * y - z * z + w * w) * inv_s
+        normals[:, 2] = 2.0 * (y * z - x * w) * inv_s
+
+        np.multiply(normals, np.float32(radius), out=positions)
+        positions += np.asarray(sphere.xyz, dtype=np.float32)
+        return positions, normals
+
+    @staticmethod
+    def slerp_array(start, end, t) -> np.ndarray:
+        """
+        Returns an ``(n, 4)`` array with the quaternions interpolated between start and end for
+        each value in t.
+
+        :param start: start orientation
+        :type start: ``Quaternion``
+        :param end: end orientation
+        :type end: ``Quaternion``
+        :param t: interpolation values between 0 and 1
+        :type t: ``np.ndarray``
+        :returns: ``np.ndarray``
+
+        q(t) = (sin((1 - t) * omega) * start + sin(t * omega) * end) / sin(omega)
+
+        When start and end are close (``dot > NLERP_THRESHOLD``, less than ~28 degrees of rotation) the
+        normalized linear interpolation is used instead. It is visually the same and needs no trigonometry.
+
+        """
+
+        s = np.asarray(start, dtype=np.float32)
+        e = np.asarray(end, dtype=np.float32)
+
+        d = np.dot(s, e)
+        if d < 0.0:
+            # take the shortest path
+            e, d = -e, -d
+
+        if d > NLERP_THRESHOLD:
+            q = (1.0 - t)[:, None] * s + t[:, None] * e
+            q /= np.linalg.norm(q, axis=1, keepdims=True)
+            return q
+
+        omega = np.arccos(np.clip(d, -1.0, 1.0))
+        sin_omega = np.sin(omega)
+
+        a = np.sin((1.0 - t) * omega) / sin_omega
+        b = np.sin(t * omega) / sin_omega
+        return a[:, None] * s + b[:, None] * e
+
     def get_angle_from_point0(self, target_sphere, point):
         """
         calculate the angle between the sphere starting point and a point on the sphere
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+"""
+Numba compiled SLERP kernel for surface edges. Fills the interleaved vertex buffer of an edge
+(vertex, texture, normal) in a single loop without creating temporary numpy arrays.
+
+Numba is optional. When it is not installed ``NUMBA_AVAILABLE`` is ``False`` and the edges use the
+numpy implementation in :class:`~sphere_base.calc.Calc` instead.
+
+"""
+
+from sphere_base.calc import NLERP_THRESHOLD
+import numpy as np
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # numba is not installed, return the function unchanged
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def slerp_fill(start, end, n, radius, center, out):
+    """
+    Interpolates n orientations between start and end and writes position, texture and normal of each
+    point into the first n rows of out.
+
+    :param start: start orientation
+    :type start: ``np.ndarray`` of 4 floats
+    :param end: end orientation
+    :type end: ``np.ndarray`` of 4 floats
+    :param n: number of points on the edge
+    :type n: ``int``
+    :param radius: radius of the sphere
+    :type radius: ``float``
+    :param center: xyz position of the sphere
+    :type center: ``np.ndarray`` of 3 floats
+    :param out: ``(max_points, 8)`` float32 buffer that receives the results
+    :type out: ``np.ndarray``
+
+    """
+
+    s0, s1, s2, s3 = start[0], start[1], start[2], start[3]
+    e0, e1, e2, e3 = end[0], end[1], end[2], end[3]
+
+    d = s0 * e0 + s1 * e1 + s2 * e2 + s3 * e3
+    if d < 0.0:
+        # take the shortest path
+        e0, e1, e2, e3, d = -e0, -e1, -e2, -e3, -d
+
+    # close orientations use NLERP, the normalization is done by inv_s below
+    use_nlerp = d > NLERP_THRESHOLD
+    omega = math.acos(min(d, 1.0))
+    sin_omega = math.sin(omega)
+
+    step = 1.0 / n
+    for i in range(n):
+        t = i * step
+        if use_nlerp:
+            a, b = 1.0 - t, t
+        else:
+            a = math.sin((1.0 - t) * omega) / sin_omega
+            b = math.sin(t * omega) / sin_omega
+
+        x = a * s0 + b * e0
+        y = a * s1 + b * e1
+        z = a * s2 + b * e2
+        w = a * s3 + b * e3
+        inv_s = 1.0 / (x * x + y * y + z * z + w * w)
+
+        # the node vector [0, 1, 0] rotated by the quaternion is the normal of the point
+        nx = 2.0 * (x * y + z * w) * inv_s
+        ny = (-x * x + y * y - z * z + w * w) * inv_s
+        nz = 2.0 * (y * z - x * w) * inv_s
+
+        out[i, 0] = nx * radius + center[0]
+        out[i, 1] = ny * radius + center[1]
+        out[i, 2] = nz * radius + center[2]
+        out[i, 3] = 1.0
+        out[i, 4] = 1.0
+        out[i, 5] = nx
+        out[i, 6] = ny
+        out[i, 7] = nz
+
+
+def warm_up():
+    """
+    Compiles the kernel with dummy arguments so the first edge that is drawn does not have to wait for it.
+
+    """
+    if NUMBA_AVAILABLE:
+        q = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float32)
+        slerp_fill(q, q, 1, 1.0, np.zeros(3, dtype=np.float32), np.empty((1, 8), dtype=np.float32))
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+"""
+Edge pool module. Contains the EdgePool class. All surface edges on a sphere store their points in a single
+vertex buffer, so they can be drawn with one OpenGL call instead of one call per edge.
+
+"""
+
+from OpenGL.GL import GL_DYNAMIC_DRAW
+from sphere_base.model.model import Model
+from sphere_base.utils import dump_exception
+from sphere_base.constants import *
+import numpy as np
+
+POOL_SIZE = 4096  # initial number of points in the pool, it grows when needed
+
+
+class EdgePool:
+    """
+    Class holding the points of all :class:`~sphere_base.edge.surface_edge.SurfaceEdge` on a ``Sphere``.
+
+    Each edge gets a slice of the pool. The slice has some room to spare, so an edge can grow a little while
+    it is being dragged without moving. When an edge no longer fits it is moved to the end of the pool.
+    Space left behind by moved or removed edges is reclaimed when the pool is full.
+
+    """
+
+    def __init__(self, sphere):
+        """
+        Constructor of the ``EdgePool`` class.
+
+        :param sphere: The sphere the edges are on
+        :type sphere: :class:`~sphere_iot.uv_sphere.Sphere`
+
+        :Instance Variables:
+
+            - **buffer** - ``(n, 8)`` float32 array with vertex, texture and normal of all points
+            - **model** - :class:`~sphere_iot.uv_models.Model` shared by all edges on the sphere
+
+        """
+        self.sphere = sphere
+        self.uv = sphere.uv
+
+        self.buffer = np.empty((POOL_SIZE, 8), dtype=np.float32)
+        self._slots = {}  # edge: [first, count, size]
+        self._end = 0  # first free point at the end of the pool
+
+        self._gl_size = 0  # number of points allocated in the OpenGL buffer
+        self._dirty_start, self._dirty_end = 0, 0  # range of points that need to be uploaded
+        self._groups = None  # cached draw calls, rebuilt after edges are added, removed, moved or restyled
+
+        self.model = self.set_up_model('edge')
+        self.mesh_id = self.model.meshes[0].mesh_id
+        self.model.name = 'edge_pool_' + str(self.mesh_id)
+        self.scale = [1.0, 1.0, 1.0]
+
+    def set_up_model(self, model_name):
+        # get the shaders for the edge
+        data = MODELS[model_name]
+        geometry_shader = None if data["geometry_shader"] == "none" else data["geometry_shader"]
+
+        # create a model for the edges
+        model = Model(
+                      models=self.uv.models,
+                      model_id=0,
+                      model_name=model_name,
+                      obj_file="",
+                      shader=data["shader"],
+                      vertex_shader=data["vertex_shader"],
+                      fragment_shader=data["fragment_shader"],
+                      geometry_shader=geometry_shader)
+
+        return model
+
+    def allocate(self, edge, number_of_points: int) -> np.ndarray:
+        """
+        Returns the ``(n, 8)`` slice of the pool where the edge writes its points. The slice is uploaded
+        to OpenGL before the next draw.
+
+        :param edge: The edge that needs the space
+        :type edge: :class:`~sphere_base.edge.surface_edge.SurfaceEdge`
+        :param number_of_points: number of points on the edge
+        :type number_of_points: ``int``
+        :returns: ``np.ndarray``
+
+        """
+        slot = self._slots.get(edge)
+
+        if slot is None or number_of_points > slot[2]:
+            self.remove(edge)
+
+            # leave some room for the edge to grow while dragging
+            size = number_of_points + number_of_points // 4 + 4
+
+            if self._end + size > len(self.buffer):
+                self._compact()
+            if self._end + size > len(self.buffer):
+                self._grow(self._end + size)
+
+            slot = [self._end, 0, size]
+            self._slots[edge] = slot
+            self._end += size
+
+        first = slot[0]
+        if slot[1] != number_of_points:
+            slot[1] = number_of_points
+            self._groups = None
+        self._mark_dirty(first, first + number_of_points)
+        return self.buffer[first:first + number_of_points]
+
+    def remove(self, edge):
+        """
+        Removes the edge from the pool
+
+        :param edge: The edge to remove
+        :type edge: :class:`~sphere_base.edge.surface_edge.SurfaceEdge`
+
+        """
+        slot = self._slots.pop(edge, None)
+        if slot:
+            self._groups = None
+            if slot[0] + slot[2] == self._end:
+                # the last slice can be reused straight away
+                self._end = slot[0]
+
+    def invalidate(self):
+        """
+        Rebuilds the draw calls before the next draw. Called by the edges when their color or line width
+        changes.
+
+        """
+        self._groups = None
+
+    def _compact(self):
+        # move all edges to the front of the pool, removing the gaps
+        position = 0
+        for slot in sorted(self._slots.values()):
+            first, count, size = slot
+            if first != position:
+                self.buffer[position:position + count] = self.buffer[first:first + count]
+                slot[0] = position
+            position += size
+        self._end = position
+        self._mark_dirty(0, position)
+        self._groups = None
+
+    def _grow(self, minimum_size: int):
+        buffer = np.empty((max(minimum_size, len(self.buffer) * 2), 8), dtype=np.float32)
+        buffer[:self._end] = self.buffer[:self._end]
+        self.buffer = buffer
+
+    def _mark_dirty(self, start: int, end: int):
+        if self._dirty_start == self._dirty_end:
+            self._dirty_start, self._dirty_end = start, end
+        else:
+            self._dirty_start = min(self._dirty_start, start)
+            self._dirty_end = max(self._dirty_end, end)
+
+    def _upload(self):
+        # upload the changed points to OpenGL
+        loader = self.model.loader
+
+        if self._gl_size < len(self.buffer):
+            loader.load_mesh_into_opengl(self.mesh_id, self.buffer, None, self.model.shader, usage=GL_DYNAMIC_DRAW)
+            self._gl_size = len(self.buffer)
+        elif self._dirty_start != self._dirty_end:
+            start, end = self._dirty_start, self._dirty_end
+            loader.update_mesh_in_opengl(self.mesh_id, self.buffer[start:end], None,
+                                         offset=start * self.buffer.strides[0])
+
+        self._dirty_start, self._dirty_end = 0, 0
+
+    def _build_groups(self) -> list:
+        # group the edges by color and line width, each group is drawn with one call
+        groups = {}
+        for edge, (first, count, size) in self._slots.items():
+            firsts, counts = groups.setdefault((tuple(edge.color), edge.line_width), ([], []))
+            firsts.append(first)
+            counts.append(count)
+
+        return [(key, (np.array(firsts, dtype=np.int32), np.array(counts, dtype=np.int32)))
+                for key, (firsts, counts) in groups.items()]
+
+    def draw(self):
+        """
+        Renders all edges in the pool. Edges with the same color and line width are drawn together.
+        """
+        if not self._slots:
+            return
+
+        try:
+            self._upload()
+
+            if self._groups is None:
+                self._groups = self._build_groups()
+
+            for (color, line_width), (firsts, counts) in self._groups:
+                self.model.shader.draw_multi(mesh_index=self.mesh_id,
+                                             firsts=firsts,
+                                             counts=counts,
+                                             position=self.sphere.xyz,
+                                             orientation=self.sphere.orientation,
+                                             scale=self.scale,
+                                             color=list(color),
+                                             line_width=line_width)
+        except Exception as e:
+            dump_exception(e)
@@ -6,17 +6,17 @@ Edges are drawn between sockets over the surface of a sphere_base.
 
 """
 
-from pyrr import quaternion, vector, Vector3
+from pyrr import quaternion
 from sphere_base.edge.graphic_edge import GraphicEdge
 from sphere_base.serializable import Serializable
-from sphere_base.model.model import Model
 from sphere_base.model.mesh import Mesh
+from sphere_base.edge._slerp_numba import NUMBA_AVAILABLE, slerp_fill
 from collections import OrderedDict
-from sphere_base.utils import dump_exception
 import numpy as np
 from sphere_base.constants import *
 
 DEBUG = False
+EPS2 = 1e-8  # squared distance the sockets need to move together before the edge is recreated
 
 
 class SurfaceEdge(Serializable):
@@ -66,7 +66,7 @@ class SurfaceEdge(Serializable):
             - **uv** - Instance of :class:`~sphere_iot.uv_universe.Universe`
             - **sphere_base** - Instance of :class:`~sphere_iot.uv_sphere.Sphere`
             - **calc** - Instance of :class:`~sphere_iot.uv_calc.UvCalc`
-            - **model** - Instance of :class:`~sphere_iot.uv_models.Model`
+            - **pool** - Instance of :class:`~sphere_base.edge.edge_pool.EdgePool` from the sphere
             - **gr_edge** - Instance of :class:`~sphere_iot.uv_graphic_edge.GraphicEdge`
             - **shader** - Instance of :class:`~sphere_iot.shader.uv_base_shader.BaseShader`
 
@@ -79,6 +79,7 @@ class SurfaceEdge(Serializable):
         self.uv = self.sphere.uv
 
         self.gr_edge = self.__class__.GraphicsEdge_class(self)
+        self.pool = self.sphere.edge_pool  # the points of the edge are stored and drawn by the pool
 
         self._start_socket, self._end_socket = None, None
         self.start_socket = socket_start if socket_start else None
@@ -94,42 +95,13 @@ class SurfaceEdge(Serializable):
         self.edge_type = 0
         self.orientation = self.sphere.orientation
         self._new_edge = True
-        self.model = self.set_up_model('edge')
-
-        self.mesh = self.model.meshes[0]
-        self.mesh_id = self.mesh.mesh_id
-
-        self.model.name = 'edge_' + str(self.mesh_id)
+        self._endpoints_cache_key, self._endpoints_cache_val = None, None
+        self._last_n, self._last_start_xyz, self._last_end_xyz = 0, None, None
 
         self.radius = self.sphere.radius  # - 0.01
         self.sphere.add_item(self)  # register the edge to the base for rendering
         self.create_edge()
 
-    def set_up_model(self, model_name):
-        shader, vertex_shader, fragment_shader, geometry_shader = None, None, None, None
-
-        # get the shaders for the edge
-        for _name in MODELS.keys():
-            if _name == model_name:
-                shader = MODELS[_name]["shader"]
-                vertex_shader = MODELS[_name]["vertex_shader"]
-                fragment_shader = MODELS[_name]["fragment_shader"]
-                geometry_shader = MODELS[_name]["geometry_shader"]
-                geometry_shader = None if geometry_shader == "none" else geometry_shader
-
-        # create a model for the edge
-        model = Model(
-                      models=self.uv.models,
-                      model_id=0,
-                      model_name=model_name,
-                      obj_file="",
-                      shader=shader,
-                      vertex_shader=vertex_shader,
-                      fragment_shader=fragment_shader,
-                      geometry_shader=geometry_shader)
-
-        return model
-
     @property
     def start_socket(self):
         """
@@ -182,6 +154,38 @@ class SurfaceEdge(Serializable):
         if self.end_socket is not None:
             self.end_socket.add_edge(self)
 
+    @property
+    def color(self):
+        """
+        Color of the edge
+
+        :getter: Returns the color
+        :setter: Sets the color and lets the pool know it needs to redraw
+        :type: ``list`` of 4 floats
+        """
+        return self._color
+
+    @color.setter
+    def color(self, color):
+        self._color = color
+        self.pool.invalidate()
+
+    @property
+    def line_width(self):
+        """
+        Line width of the edge
+
+        :getter: Returns the line width
+        :setter: Sets the line width and lets the pool know it needs to redraw
+        :type: ``int``
+        """
+        return self._line_width
+
+    @line_width.setter
+    def line_width(self, line_width):
+        self._line_width = line_width
+        self.pool.invalidate()
+
     def update_collision_object(self):
         # set the collision object for mouse pointer ray collision
         self.sphere.uv.mouse_ray.reset_position_collision_object(self, self.vert)
@@ -206,6 +210,15 @@ class SurfaceEdge(Serializable):
         # create an edge for the first time or recreate it during dragging
 
         if self.start_socket and self.end_socket:
+            start_xyz = np.asarray(self.start_socket.xyz, dtype=np.float32)
+            end_xyz = np.asarray(self.end_socket.xyz, dtype=np.float32)
+
+            if self._last_n:
+                # A movement this small changes the number of points by one at most. Keep the current edge.
+                dsq = np.sum((start_xyz - self._last_start_xyz) ** 2) + np.sum((end_xyz - self._last_end_xyz) ** 2)
+                if dsq < EPS2:
+                    return
+
             count = self.gr_edge.count_vertices(self.start_socket.xyz, self.end_socket.xyz,
                                                 self.radius, self.gr_edge.unit_length)
 
@@ -213,68 +226,68 @@ class SurfaceEdge(Serializable):
 
             if count > 0:
                 self.update_line_points_position(count, step)
+                self._last_n, self._last_start_xyz, self._last_end_xyz = count, start_xyz, end_xyz
 
     def update_line_points_position(self, number_of_vertices: int, step: float):
         """
         Creates an array of vertex locations. SLERP is used to find angles with the center of the sphere_base for
         each of the points. Each point receives also a normal.
 
+        All points are calculated in one go instead of point by point.
+
         :param number_of_vertices: Number of points on the edge
         :type number_of_vertices: ``int``
         :param step: percentage of increase for each point on the edge
         :type step: ``float``
         """
 
-        start, end = self.get_edge_start_end()
-        self.vert = []
-        vertices = []  # vertex coordinates
-        buffer = []
-        indices = []
-
-        tex = [1.0, 1.0]  # made up surface edge, that needs to be added to the buffer
-        for i in range(number_of_vertices):
-            pos = quaternion.slerp(start, end, step * i)
-
-            p = self.calc.move_to_position(pos, self.sphere, self.sphere.radius)
-            n = vector.normalize(Vector3(p) - Vector3(self.sphere.xyz))  # finding the normal of the vertex
-
-            vertices, buffer, indices = self.expand_mesh(vertices, buffer, indices, p, tex, n, i)
+        buffer = self.pool.allocate(self, number_of_vertices)
+        self.fill_line_points_buffer(number_of_vertices, step, buffer)
+        self.vert = buffer[:, 0:3].tolist()  # we need this for pybullet
 
         if self._new_edge:
             # creating a collision object for mouse ray collisions
             self.collision_object_id = self.sphere.uv.mouse_ray.create_collision_object(self, self.vert)
             self._new_edge = False
 
-        self.mesh.vertices = np.array(vertices, dtype=np.float32)
-        self.mesh.indices = np.array(indices, dtype='uint32')
-        self.mesh.buffer = np.array(buffer, dtype=np.float32)
-        self.mesh.indices_len = len(indices)
-
         self.xyz = self.sphere.xyz
-        self.model.loader.load_mesh_into_opengl(self.mesh_id, self.mesh.buffer,
-                                                self.mesh.indices, self.model.shader)
-
-    def expand_mesh(self, vertices, buffer, indices, point, texture, normals, i):
-        # This can be used to expanding each point into a mesh.
-        p = point
-        self.vert.append([p[0], p[1], p[2]])  # we need this for pybullet
-        vertices.extend(p)  # extending the vertices list with the vertex
-        buffer = self.extend_buffer(buffer, point, texture, normals)
-        indices.append(i)
-        return vertices, buffer, indices
-
-    @staticmethod
-    def extend_buffer(buffer, vertex, texture, normal):
-        buffer.extend(vertex)  # extending the buffer with the vertex
-        buffer.extend(texture)  # extending the buffer with the texture
-        buffer.extend(normal)  # extending the buffer with the normal
-        return buffer
+
+    def fill_line_points_buffer(self, number_of_vertices: int, step: float, out: np.ndarray):
+        """
+        Writes the vertex, texture and normal of each point on the edge into out.
+
+        Uses the compiled kernel when numba is installed, otherwise numpy.
+
+        :param number_of_vertices: Number of points on the edge
+        :type number_of_vertices: ``int``
+        :param step: percentage of increase for each point on the edge
+        :type step: ``float``
+        :param out: ``(n, 8)`` float32 array that receives the points
+        :type out: ``np.ndarray``
+        """
+
+        start, end = self.get_edge_start_end()
+
+        if NUMBA_AVAILABLE:
+            slerp_fill(np.asarray(start, dtype=np.float32), np.asarray(end, dtype=np.float32), number_of_vertices,
+                       float(self.sphere.radius), np.asarray(self.sphere.xyz, dtype=np.float32), out)
+            return
+
+        t = np.arange(number_of_vertices, dtype=np.float32) * np.float32(step)
+        orientations = self.calc.slerp_array(start, end, t)
+        self.calc.move_to_positions(orientations, self.sphere, self.sphere.radius, out=out)
+        out[:, 3:5] = 1.0  # made up surface edge texture coordinates
 
     def get_edge_start_end(self):
         """
-        returns start and end angles in quaternions.
+        returns start and end angles in quaternions. The result is cached until one of the sockets moves.
 
         """
+        key = (id(self.start_socket), self.start_socket.moved_gen, id(self.end_socket), self.end_socket.moved_gen,
+               self.radius)
+        if key == self._endpoints_cache_key:
+            return self._endpoints_cache_val
+
         # get clearance from start socket
         r0 = self.start_socket.node.gr_node.node_disc_radius
         r1 = self.end_socket.node.gr_node.node_disc_radius
@@ -291,6 +304,7 @@ class SurfaceEdge(Serializable):
         end = quaternion.slerp(end_angle, start_angle,  step)
 
         # start and end in angles
+        self._endpoints_cache_key, self._endpoints_cache_val = key, (start, end)
         return start, end
 
     def update_content(self, value, item_id):
@@ -341,19 +355,11 @@ class SurfaceEdge(Serializable):
         self.start_socket.remove_edge(self)
         self.end_socket.remove_edge(self)
         self.sphere.remove_item(self)
+        self.pool.remove(self)
 
         if self.collision_object_id:
             self.sphere.uv.mouse_ray.delete_collision_object(self)
 
-    def draw(self):
-        """
-        Renders the edge.
-        """
-        try:
-            self.model.draw(self, color=self.color, line_width=self.line_width)
-        except Exception as e:
-            dump_exception(e)
-
     def serialize(self):
         return OrderedDict([
             ('id', self.id),
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 # Do not remove these!!!
-# -------------- these will be dynamically late loaded! -----------------------
+# -------------- these are looked up by name in SHADERS! -----------------------
 from sphere_base.shader.skybox_shader import SkyboxShader
 from sphere_base.shader.sphere_shader import SphereShader
 from sphere_base.shader.node_shader import NodeShader
@@ -26,6 +26,24 @@ import pathlib
 
 DEBUG = False
 
+# shader classes by the name used in the MODELS dictionary
+SHADERS = {
+    "SkyboxShader": SkyboxShader,
+    "SphereShader": SphereShader,
+    "NodeShader": NodeShader,
+    "SocketShader": SocketShader,
+    "FlatShader": FlatShader,
+    "DefaultShader": DefaultShader,
+    "CircleShader": CircleShader,
+    "SquareShader": SquareShader,
+    "SphereEdgeShader": SphereEdgeShader,
+    "CrossShader": CrossShader,
+    "HoloSphereShader": HoloSphereShader,
+    "SphereSmallShader": SphereSmallShader,
+    "EdgeShader": EdgeShader,
+    "DragEdgeShader": DragEdgeShader,
+}
+
 
 class Model(GraphicItem):
     Mesh_class = Mesh
@@ -88,7 +106,7 @@ class Model(GraphicItem):
         self.texture_coordinates = []
 
         # passing shader source file names to the shader
-        self.shader = eval(shader)(self, vertex_shader, fragment_shader, geometry_shader)
+        self.shader = SHADERS[shader](self, vertex_shader, fragment_shader, geometry_shader)
 
         if ".obj" == pathlib.Path(obj_file).suffix:
             self.meshes = self.loader.get_meshes(self, obj_file)
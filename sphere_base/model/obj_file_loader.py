@@ -167,7 +167,7 @@ class ObjectFileLoader:
             end = start + 8
             print(buffer[start:end])
 
-    def load_mesh_into_opengl(self, mesh_id=0, buffer=None, indices=None, shader=""):
+    def load_mesh_into_opengl(self, mesh_id=0, buffer=None, indices=None, shader="", usage=GL_STATIC_DRAW):
         """
         Loads a single mesh into Opengl buffers
 
@@ -175,10 +175,12 @@ class ObjectFileLoader:
         :type mesh_id: ``int``
         :param buffer: Buffer array
         :type buffer: ``np.array``
-        :param indices: Indices array
+        :param indices: Indices array, ``None`` for meshes drawn without an element buffer
         :type indices: ``np.array``
         :param shader: 'Shader' to use for this :class:`~sphere_iot.uv_models.Mesh`
         :type shader: Overridden version of :class:`~sphere_iot.shader.uv_base_shader.BaseShader`
+        :param usage: ``GL_STATIC_DRAW`` or ``GL_DYNAMIC_DRAW`` for meshes that change, like edges
+        :type usage: ``GLenum``
 
         """
 
@@ -187,11 +189,12 @@ class ObjectFileLoader:
 
         # vertex Buffer Object
         glBindBuffer(GL_ARRAY_BUFFER, self.config.VBO[mesh_id])
-        glBufferData(GL_ARRAY_BUFFER, buffer.nbytes, buffer, GL_STATIC_DRAW)
+        glBufferData(GL_ARRAY_BUFFER, buffer.nbytes, buffer, usage)
 
         # element Buffer Object
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.config.EBO[mesh_id])
-        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        if indices is not None:
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.config.EBO[mesh_id])
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, usage)
 
         # vertex positions
         # Enable first the Vertex Attribute so that OpenGL can use it
@@ -221,6 +224,36 @@ class ObjectFileLoader:
 
         shader.set_environment()
 
+    def update_mesh_in_opengl(self, mesh_id=0, buffer=None, indices=None, offset=0):
+        """
+        Overwrites the data of a mesh that is already loaded with ``GL_DYNAMIC_DRAW``. The OpenGL buffers
+        are not reallocated, so the new data must fit in the buffers loaded earlier.
+
+        :param mesh_id: id of the :class:`~sphere_iot.uv_models.Mesh` to update
+        :type mesh_id: ``int``
+        :param buffer: Buffer array
+        :type buffer: ``np.array``
+        :param indices: Indices array, ``None`` for meshes drawn without an element buffer
+        :type indices: ``np.array``
+        :param offset: offset in bytes in the vertex buffer where the data is written
+        :type offset: ``int``
+
+        """
+
+        self.context.makeCurrent(self.uv_widget.surface)
+        glBindVertexArray(self.config.VAO[mesh_id])
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.config.VBO[mesh_id])
+        glBufferSubData(GL_ARRAY_BUFFER, offset, buffer.nbytes, buffer)
+
+        if indices is not None:
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.config.EBO[mesh_id])
+            glBufferSubData(GL_ELEMENT_ARRAY_BUFFER, 0, indices.nbytes, indices)
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
     def load_all_textures_into_opengl(self):
         """
         Gets all the images and textures in the config dictionary. Retrieves image file location and
@@ -11,6 +11,7 @@ from sphere_base.node.graphic_socket import GraphicSocket
 from sphere_base.calc import Calc
 from sphere_base.constants import *
 from collections import OrderedDict
+import numpy as np
 
 DEBUG = False
 DEBUG_REMOVE_WARNINGS = False
@@ -49,6 +50,7 @@ class Socket(Serializable):
             - **collision_object_id** - id of the collision cylinder pointing out.
             - **xyz** - ``Vector`` location of the ``Socket``.
             - **pos_orientation_offset** - copy from quaternion position of the node.
+            - **moved_gen** - ``int`` increased each time ``pos_orientation_offset`` changes.
             - **orientation** - quaternion with the orientation of the disc pointing away from the center of
               the sphere_base.
             - **scale** - scaling the node with the gr_socket.scale value.
@@ -71,6 +73,9 @@ class Socket(Serializable):
         self.orientation = self.node.orientation
         self.cumulative_rotation = self.node.cumulative_rotation
         self.xyz = self.node.get_position(self.radius)
+
+        self._pos_orientation_offset = None
+        self.moved_gen = 0
         self.pos_orientation_offset = self.node.pos_orientation_offset
 
         self.edges = []
@@ -84,6 +89,23 @@ class Socket(Serializable):
 
         self.update_position()
 
+    @property
+    def pos_orientation_offset(self):
+        """
+        Position of the socket on the sphere
+
+        :getter: Returns the quaternion position of the socket
+        :setter: Sets the position and increases ``moved_gen`` when the position really changed
+        :type: ``Quaternion``
+        """
+        return self._pos_orientation_offset
+
+    @pos_orientation_offset.setter
+    def pos_orientation_offset(self, value):
+        if value is not self._pos_orientation_offset and not np.array_equal(value, self._pos_orientation_offset):
+            self.moved_gen += 1
+        self._pos_orientation_offset = value
+
     def create_collision_object(self) -> int:
         """
         Creating a``pybullet`` collision object in the form of a cylinder with the same size
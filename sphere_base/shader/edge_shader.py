@@ -39,3 +39,35 @@ class EdgeShader(BaseShader):
         glDisable(GL_LINE_SMOOTH)
         glDisable(GL_POLYGON_SMOOTH)
         glDisable(GL_CULL_FACE)
+
+    def draw_multi(self, mesh_index: int = 0, firsts=None, counts=None, position=None, orientation=None, scale=None,
+                   color=None, line_width=1):
+        """
+        Draws many line strips from the same vertex buffer with a single ``glMultiDrawArrays`` call.
+
+        :param mesh_index: ID of the Mesh holding all the line strips
+        :type mesh_index: ``int``
+        :param firsts: first point of each line strip
+        :type firsts: ``np.ndarray`` int32
+        :param counts: number of points of each line strip
+        :type counts: ``np.ndarray`` int32
+
+        """
+
+        super().draw(mesh_index=mesh_index, position=position, orientation=orientation, scale=scale, color=color,
+                     line_width=line_width)
+
+        self.use()
+        glBindVertexArray(self.config.VAO[mesh_index])
+
+        glUniform4f(self.a_color, *color)
+        glLineWidth(line_width)
+        glEnable(GL_CULL_FACE)
+        glEnable(GL_POLYGON_SMOOTH)
+        glEnable(GL_LINE_SMOOTH)
+
+        glMultiDrawArrays(GL_LINE_STRIP, firsts, counts, len(firsts))
+
+        glDisable(GL_LINE_SMOOTH)
+        glDisable(GL_POLYGON_SMOOTH)
+        glDisable(GL_CULL_FACE)
@@ -14,6 +14,7 @@ from collections import OrderedDict
 from sphere_base.node.node import Node
 from sphere_base.edge.edge_drag import EdgeDrag
 from sphere_base.edge.surface_edge import SurfaceEdge
+from sphere_base.edge.edge_pool import EdgePool
 from sphere_base.sphere.sphere_lines import SphereLines
 from sphere_base.history import History
 from pyrr import quaternion
@@ -38,6 +39,7 @@ class Sphere(Serializable):
     Edge_class = SurfaceEdge
     Calc_class = Calc
     Edge_drag_class = EdgeDrag
+    EdgePool_class = EdgePool
     History_class = History
 
     def __init__(self, universe, position: list = None, texture_id: int = None, sphere_type='sphere_base'):
@@ -58,6 +60,7 @@ class Sphere(Serializable):
             - **calc** - Instance of :class:`~sphere_iot.uv_calc.UvCalc`
             - **config** - Instance of :class:`~sphere_iot.uv_config.UvConfig`
             - **edge_drag** - Instance of :class:`~sphere_iot.uv_edge_drag.EdgeDrag`
+            - **edge_pool** - Instance of :class:`~sphere_base.edge.edge_pool.EdgePool`
             - **history** - Instance of :class:`~sphere_iot.uv_history.History`
             - **shader** - Instance of :class:`~sphere_iot.shader.uv_sphere_shader.SphereShader`
 
@@ -116,6 +119,7 @@ class Sphere(Serializable):
         self.Edge = self.__class__.Edge_class
         self.calc = self.__class__.Calc_class()
         self.edge_drag = self.__class__.Edge_drag_class(self)
+        self.edge_pool = self.__class__.EdgePool_class(self)
         self.history = self.__class__.History_class(self)
 
         self.xyz = position if position else ([randint(-25, 25), randint(-25, 25), randint(-25, 25)])
@@ -388,6 +392,7 @@ class Sphere(Serializable):
         for item in edges:
             if item in self.items:
                 self.items.remove(item)
+            self.edge_pool.remove(item)  # the pool draws every edge it holds
 
     def update_item_positions(self):
         """
@@ -658,11 +663,12 @@ class Sphere(Serializable):
         for item in self.items:
             if item.type == "sphere_node":
                 item.draw()
-            elif item.type == "edge":
-                item.draw()
             elif item.type == "sphere_lines":
                 item.draw()
 
+        # all edges are drawn together
+        self.edge_pool.draw()
+
         if self.edge_drag.dragging:
             self.edge_drag.draw()
 
@@ -6,16 +6,18 @@ current implementation there is only need for a single camera object.
 
 """
 
-from pyrr import Vector3, Vector4, vector, matrix44
+from pyrr import matrix44
 from sphere_base.sphere_universe.camera_movement import CameraMovement
 from sphere_base.utils import dump_exception
 from sphere_base.serializable import Serializable
-from collections import OrderedDict
+from collections import OrderedDict, deque
+import numpy as np
 import json
 
 MOUSE_SENSITIVITY = .1
-DEFAULT_TARGET = Vector3([0.0, 0.0, 0.0])
-DEFAULT_POS = Vector3([0.0, 0.0, 3.0])
+DEFAULT_TARGET = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+DEFAULT_POS = np.array([0.0, 0.0, 3.0], dtype=np.float32)
+WORLD_UP = np.array([0.0, 1.0, 0.0], dtype=np.float32)
 
 
 class Camera(Serializable):
@@ -43,18 +45,22 @@ class Camera(Serializable):
 
         :Instance Variables:
 
-        - **target** - ``Vector`` xyz position of the target sphere_base.
-        - **distance_to_target** - distance between camera and center of the target sphere_base. (``Vector3``).
-        - **camera_direction** - normalized ``vector3`` pointing away from the center of the target sphere_base
+        - **target** - ``np.ndarray`` xyz position of the target sphere_base.
+        - **distance_to_target** - distance between camera and center of the target sphere_base. (``float``).
+        - **camera_direction** - normalized ``np.ndarray`` pointing away from the center of the target sphere_base
           through the center of the camera.
-        - **camera_up** - ``Vector3`` with the ``up`` position of the camera.
-        - **xyz** - position of the camera (``Vector3``).
+        - **camera_up** - ``np.ndarray`` with the ``up`` position of the camera.
+        - **xyz** - position of the camera (``np.ndarray``).
         - **mouse_sensitivity** - ``float`` modifier to adjust the sensitivity of the mouse when moving the camera.
 
         """
 
         super().__init__("camera")
 
+        # the view matrix is only recalculated after the camera position or target changed
+        self._view_dirty = True
+        self._cached_view = None
+
         # camera target pointing at origin
         self.target = DEFAULT_TARGET
         self.xyz = DEFAULT_POS
@@ -63,8 +69,8 @@ class Camera(Serializable):
         self.camera_up = None
 
         self.mouse_sensitivity = MOUSE_SENSITIVITY
-        self.movement_stack = []
-        self.target_stack = []
+        self.movement_stack = deque()
+        self.target_stack = deque()
 
         self.uv = parent
         self.target_sphere = None
@@ -79,6 +85,38 @@ class Camera(Serializable):
         view = self.get_view_matrix()
         self.config.set_view_loc(view)
 
+    @property
+    def xyz(self):
+        """
+        Position of the camera
+
+        :getter: Returns the position of the camera
+        :setter: Sets the position of the camera and marks the view matrix for recalculation
+        :type: ``np.ndarray`` float32
+        """
+        return self._xyz
+
+    @xyz.setter
+    def xyz(self, value):
+        self._xyz = np.array(value, dtype=np.float32)
+        self._view_dirty = True
+
+    @property
+    def target(self):
+        """
+        Position the camera is looking at
+
+        :getter: Returns the target position
+        :setter: Sets the target position and marks the view matrix for recalculation
+        :type: ``np.ndarray`` float32
+        """
+        return self._target
+
+    @target.setter
+    def target(self, value):
+        self._target = np.array(value, dtype=np.float32)
+        self._view_dirty = True
+
     def _set_view(self):
         sphere_xyz = self.target_sphere.xyz if self.target_sphere else DEFAULT_TARGET
 
@@ -86,12 +124,13 @@ class Camera(Serializable):
         self.distance_to_target = self.get_distance_to_target()
 
         # direction vector, points away from target
-        self.camera_direction = vector.normalize(Vector3(self.xyz) - Vector3(sphere_xyz))
+        direction = self.xyz - np.asarray(sphere_xyz, dtype=np.float32)
+        self.camera_direction = direction / np.linalg.norm(direction)
 
         # right vector that represents the positive x-axis of the camera space
-        up = Vector3([0.0, 1.0, 0.0])
-        camera_right = vector.normalize(Vector3.cross(up, self.camera_direction))
-        self.camera_up = Vector3.cross(Vector3(self.camera_direction), Vector3(camera_right))
+        camera_right = np.cross(WORLD_UP, self.camera_direction)
+        camera_right /= np.linalg.norm(camera_right)
+        self.camera_up = np.cross(self.camera_direction, camera_right)
 
     def reset_to_default_view(self, target_sphere, offset=None):
         """
@@ -103,24 +142,28 @@ class Camera(Serializable):
         """
         pass
 
-        offset = Vector3([0.0, 0.0, target_sphere.radius * 2]) if not offset else offset
-        offset = Vector3([0.0, 0.0, target_sphere.radius * 3]) if target_sphere.radius == 1 else offset
-        offset = Vector3([0.0, 0.0, target_sphere.radius * 2.7]) if target_sphere.radius == 2 else offset
+        offset = np.array([0.0, 0.0, target_sphere.radius * 2]) if offset is None else offset
+        offset = np.array([0.0, 0.0, target_sphere.radius * 3]) if target_sphere.radius == 1 else offset
+        offset = np.array([0.0, 0.0, target_sphere.radius * 2.7]) if target_sphere.radius == 2 else offset
 
         # used when de-serializing
-        self.xyz = target_sphere.xyz + offset
+        self.xyz = np.asarray(target_sphere.xyz, dtype=np.float32) + offset
         self.move_to_new_target_sphere(target_sphere)
         self.cm.reset()
         self._set_view()
 
     def get_view_matrix(self) -> 'matrix44':
         """
-        Set view and get the look at matrix
+        Set view and get the look at matrix. The matrix is only recalculated when the camera has moved.
 
         """
 
-        self._set_view()
-        m = matrix44.create_look_at(self.xyz, self.target, self.camera_up)
+        if self._view_dirty:
+            self._set_view()
+            self._cached_view = matrix44.create_look_at(self.xyz, self.target, self.camera_up)
+            self._view_dirty = False
+
+        m = self._cached_view
         self.config.set_view_loc(m)
         return m
 
@@ -157,8 +200,12 @@ class Camera(Serializable):
 
         """
 
-        xyzw = self.cm.orbit_around_target(target_sphere, rotation, angle_up, radius)
-        self.xyz = Vector3(Vector4(xyzw).xyz)
+        xyz = self.cm.orbit_around_target(target_sphere, rotation, angle_up, radius, fast=True)
+        if xyz is None:
+            # no target sphere to orbit around
+            return
+
+        self.xyz = xyz
         view = self.get_view_matrix()
         self.config.set_view_loc(view)
 
@@ -181,7 +228,7 @@ class Camera(Serializable):
         return self.cm.rotation, self.cm.yaw
 
     def get_distance_to_target(self):
-        return vector.length(Vector3(self.target) - Vector3(self.xyz))
+        return float(np.linalg.norm(self.target - self.xyz))
 
     def draw(self):
         """
@@ -191,11 +238,9 @@ class Camera(Serializable):
         """
 
         # if a sphere has been on_current_row_changed (_selected) then move the camera to the new sphere
-        if len(self.movement_stack) > 0:
-            self.xyz = Vector3(self.movement_stack[0])
-            self.target = Vector3(self.target_stack[0])
-            del self.movement_stack[0]
-            del self.target_stack[0]
+        if self.movement_stack:
+            self.xyz = self.movement_stack.popleft()
+            self.target = self.target_stack.popleft()
 
         # The view needs to be updated before drawing. This is because OpenGL is a state machine that listens to
         # changes program wide spanning instances!
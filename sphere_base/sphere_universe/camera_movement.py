@@ -8,6 +8,7 @@ camera movement module. Contains the camera movement class. It has the calculati
 from math import sin, cos, radians
 from pyrr import Vector3, Vector4, matrix44
 from sphere_base.constants import *
+import numpy as np
 DEFAULT_TARGET = Vector3([0.0, 0.0, 0.0])
 
 
@@ -44,7 +45,7 @@ class CameraMovement:
         self.rotation = ROTATION
         self.radius = self.cam.get_distance_to_target()
 
-    def orbit_around_target(self, target, rotation: float = 0, yaw: float = 0, offset: float = 0):
+    def orbit_around_target(self, target, rotation: float = 0, yaw: float = 0, offset: float = 0, fast: bool = False):
         """
         Camera orbits around a ``Target Sphere``
 
@@ -56,6 +57,8 @@ class CameraMovement:
         :type yaw: ``int``
         :param offset: distance from center of ``Target Sphere``
         :type offset: ``float``
+        :param fast: return the new xyz position as a float32 ``np.ndarray`` instead of a ``Vector4``
+        :type fast: ``bool``
 
         """
         if self.cam.uv.target_sphere:
@@ -86,7 +89,10 @@ class CameraMovement:
         y = sin(radians(self.yaw)) * self.radius
         z = sin(radians(self.rotation)) * cos(radians(self.yaw)) * self.radius
 
-        if target:
+        if target and fast:
+            # translating is just adding the target position
+            new_xyzw = np.array([x, y, z], dtype=np.float32) + np.asarray(target.xyz, dtype=np.float32)
+        elif target:
             m = matrix44.create_from_translation(target.xyz)
 
             pos = Vector4([x, y, z, 1])
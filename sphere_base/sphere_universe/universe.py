@@ -16,6 +16,7 @@ from sphere_base.sphere_universe.rubber_band_box import RubberBand
 from sphere_base.clipboard import Clipboard
 from sphere_base.config import UvConfig
 from sphere_base.shader.default_shader import DefaultShader
+from sphere_base.edge._slerp_numba import warm_up as warm_up_edge_kernel
 from sphere_base.calc import *
 import json
 import os.path
@@ -100,6 +101,9 @@ class Universe(Serializable):
         self.rubber_band_box = self.__class__.RubberBand_class(self)
         self.clipboard = self.__class__.Clipboard_class(self)
 
+        # compile the edge kernel before the first edge is created
+        warm_up_edge_kernel()
+
         if not os.path.exists("default.json"):
             self.create_test_spheres(TEST_SPHERE_NUMBER)
 
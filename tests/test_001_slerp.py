@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+"""Tests for the vectorized and numba compiled SLERP used by the surface edges."""
+
+
+import unittest
+
+import numpy as np
+from pyrr import quaternion
+
+from sphere_base.calc import Calc
+from sphere_base.edge._slerp_numba import NUMBA_AVAILABLE, slerp_fill
+
+RADIUS = 3.0
+POINTS = 17
+Q0 = quaternion.create_from_eulers([0.3, 1.2, -0.4])
+
+
+class FakeSphere:
+    xyz = [1.0, 2.0, 3.0]
+
+
+class TestSlerp(unittest.TestCase):
+    """Compares the edge kernels with pyrr ``quaternion.slerp`` and ``Calc.move_to_position``."""
+
+    def setUp(self):
+        """Set up the quaternion pairs, each with the end that pyrr interpolates to."""
+        far = quaternion.create_from_eulers([1.3, -0.2, 0.9])
+        close = quaternion.create_from_eulers([0.35, 1.1, -0.3])
+
+        self.cases = {
+            "far": (Q0, far, far),
+            "close": (Q0, close, close),
+            "identical": (Q0, Q0, Q0),
+            "opposite sign far": (Q0, -far, -far),
+            # pyrr does not flip the end quaternion when it falls back to lerp
+            "opposite sign close": (Q0, -close, close),
+        }
+        self.assertGreater(np.dot(Q0, close), 0.97)
+        self.assertLess(np.dot(Q0, far), 0.95)
+
+        self.t = np.arange(POINTS, dtype=np.float32) / POINTS
+        self.sphere = FakeSphere()
+
+    def reference(self, start, end):
+        return np.array([Calc.move_to_position(quaternion.slerp(start, end, t), self.sphere, RADIUS)
+                         for t in self.t])
+
+    def test_001_numpy(self):
+        """Test if the numpy path matches pyrr"""
+        for name, (start, end, reference_end) in self.cases.items():
+            with self.subTest(name):
+                orientations = Calc.slerp_array(start, end, self.t)
+                positions, normals = Calc.move_to_positions(orientations, self.sphere, RADIUS)
+
+                np.testing.assert_allclose(positions, self.reference(start, reference_end), atol=1e-5)
+                np.testing.assert_allclose(normals * RADIUS + self.sphere.xyz, positions, atol=1e-5)
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba is not installed")
+    def test_002_numba(self):
+        """Test if the numba kernel matches pyrr"""
+        self._test_slerp_fill()
+
+    def test_003_slerp_fill_python(self):
+        """Test if the kernel matches pyrr when it runs as plain python"""
+        self._test_slerp_fill(getattr(slerp_fill, "py_func", slerp_fill))
+
+    def _test_slerp_fill(self, kernel=slerp_fill):
+        for name, (start, end, reference_end) in self.cases.items():
+            with self.subTest(name):
+                out = np.zeros((POINTS + 3, 8), dtype=np.float32)
+                kernel(np.asarray(start, dtype=np.float32), np.asarray(end, dtype=np.float32), POINTS, RADIUS,
+                       np.asarray(self.sphere.xyz, dtype=np.float32), out)
+
+                np.testing.assert_allclose(out[:POINTS, 0:3], self.reference(start, reference_end), atol=1e-5)
+                np.testing.assert_allclose(out[:POINTS, 3:5], 1.0)
+                np.testing.assert_allclose(out[:POINTS, 5:8] * RADIUS + self.sphere.xyz, out[:POINTS, 0:3],
+                                           atol=1e-5)
+                self.assertFalse(out[POINTS:].any())
+
+
+if __name__ == '__main__':
+    unittest.main()